@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pure-Python / NumPy mode
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below stay importable without numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# ---------------------------
+# Swing detection (3-bar fractal)
+# ---------------------------
+
+@njit(cache=True, boundscheck=False, fastmath=True)
+def detect_swings_nb(
+    h: np.ndarray,
+    l: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns (hi_idx, hi_price, lo_idx, lo_price) for a contiguous float64 pair.
+    Same rule as liquidity.detect_swings; the caller builds SwingPoint objects.
+    """
+    w = max(h.shape[0] - 2, 0)
+
+    # Pass 1: per-bar masks. Iterations are independent, so LLVM vectorizes
+    # the compares (fcmp <4 x double> in NUMBA_DUMP_OPTIMIZED on AVX2).
+    hi = np.empty(w, np.bool_)
+    lo = np.empty(w, np.bool_)
+    for j in range(w):
+        hi[j] = (h[j + 1] > h[j]) & (h[j + 1] > h[j + 2])
+        lo[j] = (l[j + 1] < l[j]) & (l[j + 1] < l[j + 2])
+
+    # Pass 2: compaction. The store slot depends on the running count, so this
+    # stays scalar; "always write, conditionally advance" keeps it branch-free.
+    hi_idx = np.empty(w, np.int64)
+    lo_idx = np.empty(w, np.int64)
+    k = 0
+    m = 0
+    for j in range(w):
+        hi_idx[k] = j + 1
+        lo_idx[m] = j + 1
+        k += hi[j]
+        m += lo[j]
+
+    hi_idx = hi_idx[:k]
+    lo_idx = lo_idx[:m]
+    return hi_idx, h[hi_idx], lo_idx, l[lo_idx]
+
+
+# ---------------------------
+# Clustering (EQH/EQL)
+# ---------------------------
+
+# No fastmath here: levels must sum in the same order as the pure-Python path.
+@njit(cache=True, boundscheck=False)
+def cluster_sweep_nb(
+    prices: np.ndarray,
+    indices: np.ndarray,
+    tolerance: float,
+    min_bars: int,
+    min_points: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Same rule as liquidity.cluster_equal_levels for one side's swing points
+    (chronological first fit, running sum per open cluster).
+    Returns (order, starts, ends, levels): cluster c is made of the input
+    positions order[starts[c]:ends[c]] (input order), with mean levels[c].
+    Clusters come out in creation order.
+    """
+    n = prices.shape[0]
+    cluster_of = np.empty(n, np.int64)
+    last = np.empty(n, np.int64)
+    total = np.empty(n, np.float64)
+    count = np.empty(n, np.int64)
+    n_open = 0
+
+    for t in range(n):
+        idx = indices[t]
+        p = prices[t]
+        # First open cluster far enough back and within tolerance of its mean
+        c = 0
+        while c < n_open:
+            if idx - last[c] >= min_bars and abs(p - total[c] / count[c]) <= tolerance:
+                break
+            c += 1
+        if c == n_open:
+            n_open += 1
+            total[c] = 0.0
+            count[c] = 0
+        cluster_of[t] = c
+        last[c] = idx
+        total[c] += p
+        count[c] += 1
+
+    # Keep clusters with >= min_points and lay their members out contiguously
+    slot = np.empty(n_open, np.int64)
+    starts = np.empty(n_open, np.int64)
+    ends = np.empty(n_open, np.int64)
+    levels = np.empty(n_open, np.float64)
+    n_out = 0
+    n_clusters = 0
+    for c in range(n_open):
+        if count[c] >= min_points:
+            slot[c] = n_clusters
+            starts[n_clusters] = n_out
+            n_out += count[c]
+            ends[n_clusters] = n_out
+            levels[n_clusters] = total[c] / count[c]
+            n_clusters += 1
+        else:
+            slot[c] = -1
+
+    order = np.empty(n_out, np.int64)
+    fill = starts[:n_clusters].copy()
+    for t in range(n):
+        s = slot[cluster_of[t]]
+        if s >= 0:
+            order[fill[s]] = t
+            fill[s] += 1
+
+    return order, starts[:n_clusters], ends[:n_clusters], levels[:n_clusters]
@@ -1,4 +1,8 @@
-from liquidity_engine.core.engine import EngineConfig, scan_signals
+import random
+
+from liquidity_engine.core.engine import EngineConfig, IncrementalEngineState, scan_signals
+from liquidity_engine.core.liquidity import detect_eqh_eql
+from liquidity_engine.models.signal import Signal
 
 # Fake data with repeated highs/lows
 highs = [10, 12, 11, 12.1, 11.2, 12.05, 11.0, 13, 12.9]
@@ -19,3 +23,46 @@ signals = scan_signals("XAUUSD", highs=highs, lows=lows, cfg=cfg, timeframe="M15
 print("Signals:", len(signals))
 for s in signals:
     print("-", s.summary())
+
+# Engine output is built without pydantic validation: it must still round-trip
+
+for s in signals:
+    Signal.model_validate(s.model_dump())
+
+# Near-zero prices: zones that would cross 0 are filtered, not emitted
+tiny = scan_signals("XAUUSD", highs=[h / 100 for h in highs], lows=[l / 100 for l in lows],
+                    cfg=EngineConfig(tolerance=0.01, min_bars_between=1, entry_buffer=0.09,
+                                     sl_buffer=0.1, min_target=0.0, min_rr=0.0))
+for s in tiny:
+    Signal.model_validate(s.model_dump())
+
+# Config invariants Signal would otherwise reject per signal
+for bad in (dict(entry_buffer=0.3, sl_buffer=0.2), dict(entry_buffer=0.0), dict(confidence_default=150)):
+    try:
+        EngineConfig(**bad)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError(f"EngineConfig accepted {bad}")
+
+print("Engine invariant checks: OK")
+
+# Live path: growing the window bar by bar must match a full rescan
+rnd = random.Random(3)
+for _ in range(10):
+    state = IncrementalEngineState()
+    price, hs, ls = 100.0, [], []
+    for t in range(150):
+        price += rnd.gauss(0, 0.3)
+        hs.append(round(price + abs(rnd.gauss(0, 0.2)), 2))
+        ls.append(round(price - abs(rnd.gauss(0, 0.2)), 2))
+        if t % 40 == 39:
+            hs[-2] += 0.5  # revised previous bar -> must fall back to a full rescan
+        live = scan_signals("XAUUSD", highs=hs, lows=ls, cfg=cfg, state=state)
+        full = scan_signals("XAUUSD", highs=hs, lows=ls, cfg=cfg)
+        assert (state.eqh_clusters, state.eql_clusters) == detect_eqh_eql(
+            hs, ls, cfg.tolerance, cfg.min_bars_between, cfg.min_points)
+        assert [s.model_dump(exclude={"created_at"}) for s in live] == \
+               [s.model_dump(exclude={"created_at"}) for s in full]
+
+print("Incremental vs full scan: OK")
@@ -1,5 +1,16 @@
+import random
+
+import numpy as np
+
+from liquidity_engine.core._nb_kernels import NUMBA_AVAILABLE
 from liquidity_engine.core.liquidity import (
+    SwingPoint,
+    _cluster_equal_levels_nb,
+    _cluster_equal_levels_py,
+    cluster_equal_levels,
     detect_eqh_eql,
+    detect_swing_arrays,
+    detect_swings,
     nearest_liquidity_above,
     nearest_liquidity_below,
 )
@@ -19,3 +30,72 @@ if eqh:
 if eql:
     lvl = eql[0].level
     print("Nearest above (to EQL lvl):", nearest_liquidity_above(lvl, eqh))
+
+# ---------------------------
+# cluster_equal_levels semantics (chronological first fit)
+# ---------------------------
+def lows_at(*pts):
+    return [SwingPoint(index=i, price=p, side="LOW") for i, p in pts]
+
+
+# Tolerance drift: 10.16 is 0.16 from the first point but only 0.11 from the
+# running mean (10.05), so it joins; 10.30 is beyond the new mean and does not.
+cl = cluster_equal_levels(lows_at((1, 10.0), (5, 10.1), (9, 10.16), (13, 10.30)),
+                          side="LOW", tolerance=0.12, min_bars_between=1)
+assert [c.indices for c in cl] == [(1, 5, 9)], cl
+
+# Spacing split: 2 and 11 are too close to 1 and 10, so they start a second
+# cluster instead of being dropped.
+cl = cluster_equal_levels(lows_at((1, 5.0), (2, 5.01), (10, 5.02), (11, 5.0)),
+                          side="LOW", tolerance=0.1, min_bars_between=5)
+assert sorted(c.indices for c in cl) == [(1, 10), (2, 11)], cl
+
+# First fit: 10.1 is within tolerance of both open clusters and joins the
+# older one (10.2), leaving 10.0 alone.
+cl = cluster_equal_levels(lows_at((1, 10.2), (2, 10.0), (3, 10.1)),
+                          side="LOW", tolerance=0.12, min_bars_between=1)
+assert [c.indices for c in cl] == [(1, 3)], cl
+
+# Swings of the other side are ignored
+pts = lows_at((3, 3.0), (7, 3.0)) + [SwingPoint(index=5, price=3.0, side="HIGH")]
+cl = cluster_equal_levels(pts, side="LOW", tolerance=0.05, min_bars_between=1)
+assert [(c.indices, c.level) for c in cl] == [((3, 7), 3.0)], cl
+
+# Compiled kernel must match the pure-Python path exactly
+if NUMBA_AVAILABLE:
+    rnd = random.Random(7)
+    for _ in range(300):
+        idx = sorted(rnd.sample(range(400), rnd.randint(0, 120)))
+        px = [round(50 + rnd.gauss(0, 1), rnd.choice([1, 2, 6])) for _ in idx]
+        args = (rnd.choice(["HIGH", "LOW"]), rnd.choice([0.05, 0.3, 1.0]),
+                rnd.choice([0, 2, 7]), rnd.choice([2, 3, 4]))
+        assert _cluster_equal_levels_nb(np.array(idx, dtype=np.int64), np.array(px), *args) == \
+               _cluster_equal_levels_py(idx, px, *args)
+
+# Column path (detect_swing_arrays -> cluster_equal_levels_arrays) matches the
+# SwingPoint path, on both sides of the short-window cutoff
+rnd = random.Random(11)
+for n in (0, 2, 3, 20, 63, 64, 500):
+    price, hs, ls = 100.0, [], []
+    for _ in range(n):
+        price += rnd.gauss(0, 0.3)
+        hs.append(round(price + abs(rnd.gauss(0, 0.2)), 2))
+        ls.append(round(price - abs(rnd.gauss(0, 0.2)), 2))
+    swings = detect_swings(hs, ls)
+    hi_idx, hi_px, lo_idx, lo_px = detect_swing_arrays(hs, ls)
+    assert hi_idx.tolist() == [s.index for s in swings if s.side == "HIGH"]
+    assert lo_px.tolist() == [s.price for s in swings if s.side == "LOW"]
+    assert detect_eqh_eql(hs, ls, 0.15, 1) == (cluster_equal_levels(swings, "HIGH", 0.15, 1),
+                                               cluster_equal_levels(swings, "LOW", 0.15, 1))
+
+print("cluster_equal_levels checks: OK")
+
+# nearest_liquidity_*: unsorted input still works; bisect path agrees on sorted input
+a, b, c = (cluster_equal_levels(lows_at((1, p), (9, p)), side="LOW", tolerance=0.1)[0]
+           for p in (1.0, 2.0, 3.0))
+assert nearest_liquidity_below(2.5, [c, a, b]) is b
+assert nearest_liquidity_above(1.5, [c, a, b]) is b
+assert nearest_liquidity_below(2.5, [a, b, c], [1.0, 2.0, 3.0]) is b
+assert nearest_liquidity_above(1.5, [a, b, c], [1.0, 2.0, 3.0]) is b
+assert nearest_liquidity_below(1.0, [a, b, c], [1.0, 2.0, 3.0]) is None
+print("nearest_liquidity checks: OK")
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from liquidity_engine.core.liquidity import (
     LiquidityCluster,
+    Side,
+    SwingPoint,
+    cluster_equal_levels,
     detect_eqh_eql,
-    nearest_liquidity_above,
-    nearest_liquidity_below,
+    detect_swings,
+    swings_at,
 )
-from liquidity_engine.models.signal import Direction, LiquidityType, RiskLabel, Signal
+from liquidity_engine.models.signal import Direction, LiquidityType, RiskLabel, Signal, SignalRaw
 
 
 @dataclass(frozen=True)
@@ -32,54 +38,166 @@ class EngineConfig:
     risk_label: RiskLabel = RiskLabel.MEDIUM
     confidence_default: int = 70
 
+    def __post_init__(self) -> None:
+        # Signals are built without pydantic validation (Signal.from_raw), so the
+        # config-level invariants of Signal are checked here, once.
+        if self.entry_buffer <= 0:
+            raise ValueError("entry_buffer must be > 0")
+        if self.sl_buffer <= self.entry_buffer:
+            raise ValueError("sl_buffer must be > entry_buffer (stop-loss outside entry zone)")
+        if not 0 <= self.confidence_default <= 100:
+            raise ValueError("confidence_default must be within 0-100")
+
+
+@dataclass
+class IncrementalEngineState:
+    """
+    Swings/clusters cached between live scans of one symbol/timeframe stream
+    (pass the same instance to scan_signals on every closed bar).
+
+    When highs/lows grew by exactly one bar and the previous last bar is
+    unchanged, only bar n-2 can become a new swing: the bar scan is skipped,
+    and clustering is redone only for the side that gained a swing (from the
+    cached swings, so results match a full scan). Anything else rescans.
+    """
+    key: Optional[Tuple[Any, ...]] = None
+    last_n: int = 0
+    last_bar: Optional[Tuple[float, float]] = None  # (high, low) at last_n - 1
+    swings: List[SwingPoint] = field(default_factory=list)
+    eqh_clusters: List[LiquidityCluster] = field(default_factory=list)
+    eql_clusters: List[LiquidityCluster] = field(default_factory=list)
+
+    def update(
+        self,
+        symbol: str,
+        timeframe: str,
+        highs: Sequence[float],
+        lows: Sequence[float],
+        cfg: EngineConfig,
+    ) -> Tuple[List[LiquidityCluster], List[LiquidityCluster]]:
+        """Returns (eqh_clusters, eql_clusters) for the current window."""
+        if len(highs) != len(lows):
+            raise ValueError("highs and lows must have same length")
+        n = len(highs)
+        key = (symbol, timeframe, cfg)
+
+        appended = (
+            key == self.key
+            and n - self.last_n == 1
+            and self.last_n >= 2
+            and self.last_bar == (highs[n - 2], lows[n - 2])
+        )
+        if appended:
+            for sp in swings_at(highs, lows, n - 2):
+                self.swings.append(sp)
+                if sp.side == "HIGH":
+                    self.eqh_clusters = self._cluster("HIGH", cfg)
+                else:
+                    self.eql_clusters = self._cluster("LOW", cfg)
+        else:
+            self.swings = detect_swings(highs, lows)
+            self.eqh_clusters = self._cluster("HIGH", cfg)
+            self.eql_clusters = self._cluster("LOW", cfg)
+
+        self.key = key
+        self.last_n = n
+        self.last_bar = (highs[n - 1], lows[n - 1]) if n else None
+        return self.eqh_clusters, self.eql_clusters
+
+    def _cluster(self, side: Side, cfg: EngineConfig) -> List[LiquidityCluster]:
+        return cluster_equal_levels(
+            self.swings,
+            side=side,
+            tolerance=cfg.tolerance,
+            min_bars_between=cfg.min_bars_between,
+            min_points=cfg.min_points,
+        )
+
 
 def _mid(entry_zone: Tuple[float, float]) -> float:
     return (entry_zone[0] + entry_zone[1]) / 2.0
 
 
+def _build_sells_bulk(
+    eqh_lvls: np.ndarray,
+    eql_lvls: np.ndarray,
+    entry_buf: float,
+    sl_buf: float,
+    min_tgt: float,
+    min_rr: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    SELL math for all EQH levels at once (both level arrays sorted ascending).
+    Returns (pair, mask, rr, sl): pair[i] is the nearest EQL below EQH i, and
+    mask marks the candidates passing the risk/reward/min_target/min_rr filters.
+    """
+    pair = np.searchsorted(eql_lvls, eqh_lvls, side="left") - 1
+    entry_lo, entry_hi = eqh_lvls - entry_buf, eqh_lvls + entry_buf
+    entry = _mid((entry_lo, entry_hi))
+    sl = eqh_lvls + sl_buf
+    target = eql_lvls[np.maximum(pair, 0)]
+    risk = sl - entry
+    reward = entry - target
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rr = np.where(risk > 0, reward / risk, 0.0)
+    mask = (pair >= 0) & (risk > 0) & (reward > 0) & (reward >= min_tgt) & (rr >= min_rr)
+    # Signal invariants: positive [low < high] zone, SL above it, positive target
+    mask &= (entry_lo > 0) & (entry_lo < entry_hi) & (sl > entry_hi) & (target > 0)
+    return pair, mask, rr, sl
+
+
+def _build_buys_bulk(
+    eql_lvls: np.ndarray,
+    eqh_lvls: np.ndarray,
+    entry_buf: float,
+    sl_buf: float,
+    min_tgt: float,
+    min_rr: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """BUY counterpart of _build_sells_bulk: pair[i] is the nearest EQH above EQL i."""
+    pair = np.searchsorted(eqh_lvls, eql_lvls, side="right")
+    entry_lo, entry_hi = eql_lvls - entry_buf, eql_lvls + entry_buf
+    entry = _mid((entry_lo, entry_hi))
+    sl = eql_lvls - sl_buf
+    target = eqh_lvls[np.minimum(pair, len(eqh_lvls) - 1)]
+    risk = entry - sl
+    reward = target - entry
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rr = np.where(risk > 0, reward / risk, 0.0)
+    mask = (pair < len(eqh_lvls)) & (risk > 0) & (reward > 0) & (reward >= min_tgt) & (rr >= min_rr)
+    # Signal invariants: positive [low < high] zone, SL below it, positive target
+    mask &= (entry_lo > 0) & (entry_lo < entry_hi) & (sl < entry_lo) & (target > 0)
+    return pair, mask, rr, sl
+
+
 def _build_sell_from_eqh(
     symbol: str,
     timeframe: str,
     eqh: LiquidityCluster,
-    eql_clusters: Sequence[LiquidityCluster],
-    cfg: EngineConfig,
-) -> Optional[Signal]:
-    entry_zone = (eqh.level - cfg.entry_buffer, eqh.level + cfg.entry_buffer)
-    sl = eqh.level + cfg.sl_buffer
-
-    target = nearest_liquidity_below(eqh.level, eql_clusters)
-    if not target:
-        return None
-
-    entry = _mid(entry_zone)
+    target: LiquidityCluster,
+    rr: float,
+    sl: float,
+    entry_buf: float,
+    confidence: int,
+    risk_label: RiskLabel,
+    created_at: datetime,
+) -> SignalRaw:
+    """Materializes a SELL that already passed the vectorized filters (rr pre-rounded)."""
+    entry_zone = (eqh.level - entry_buf, eqh.level + entry_buf)
     tp1 = target.level
 
-    risk = sl - entry
-    reward = entry - tp1
-
-    if risk <= 0 or reward <= 0:
-        return None
-
-    rr = reward / risk
-    dist_to_target = reward
-
-    # Filters
-    if dist_to_target < cfg.min_target:
-        return None
-    if rr < cfg.min_rr:
-        return None
-
-    return Signal(
+    return SignalRaw(
         symbol=symbol,
         timeframe=timeframe,
         direction=Direction.SELL,
         entry_zone=entry_zone,
         stop_loss=sl,
-        targets=[tp1],
-        rr=round(rr, 4),
+        targets=(tp1,),
+        rr=rr,
         liquidity_type=LiquidityType.EQH_TO_EQL,
-        confidence=cfg.confidence_default,
-        risk=cfg.risk_label,
+        confidence=confidence,
+        risk=risk_label,
+        created_at=created_at,
         level=eqh.level,
     )
 
@@ -88,85 +206,120 @@ def _build_buy_from_eql(
     symbol: str,
     timeframe: str,
     eql: LiquidityCluster,
-    eqh_clusters: Sequence[LiquidityCluster],
-    cfg: EngineConfig,
-) -> Optional[Signal]:
-    entry_zone = (eql.level - cfg.entry_buffer, eql.level + cfg.entry_buffer)
-    sl = eql.level - cfg.sl_buffer
-
-    target = nearest_liquidity_above(eql.level, eqh_clusters)
-    if not target:
-        return None
-
-    entry = _mid(entry_zone)
+    target: LiquidityCluster,
+    rr: float,
+    sl: float,
+    entry_buf: float,
+    confidence: int,
+    risk_label: RiskLabel,
+    created_at: datetime,
+) -> SignalRaw:
+    """Materializes a BUY that already passed the vectorized filters (rr pre-rounded)."""
+    entry_zone = (eql.level - entry_buf, eql.level + entry_buf)
     tp1 = target.level
 
-    risk = entry - sl
-    reward = tp1 - entry
-
-    if risk <= 0 or reward <= 0:
-        return None
-
-    rr = reward / risk
-    dist_to_target = reward
-
-    # Filters
-    if dist_to_target < cfg.min_target:
-        return None
-    if rr < cfg.min_rr:
-        return None
-
-    return Signal(
+    return SignalRaw(
         symbol=symbol,
         timeframe=timeframe,
         direction=Direction.BUY,
         entry_zone=entry_zone,
         stop_loss=sl,
-        targets=[tp1],
-        rr=round(rr, 4),
+        targets=(tp1,),
+        rr=rr,
         liquidity_type=LiquidityType.EQL_TO_EQH,
-        confidence=cfg.confidence_default,
-        risk=cfg.risk_label,
+        confidence=confidence,
+        risk=risk_label,
+        created_at=created_at,
         level=eql.level,
     )
 
 
+def scan_signals_raw(
+    symbol: str,
+    highs: Sequence[float],
+    lows: Sequence[float],
+    cfg: Optional[EngineConfig] = None,
+    timeframe: str = "M15",
+    state: Optional[IncrementalEngineState] = None,
+) -> List[SignalRaw]:
+    """
+    Engine-internal variant of scan_signals returning unvalidated SignalRaw
+    records (same ordering). Use when the output never leaves the engine.
+    """
+    cfg = cfg or EngineConfig()
+    # Validate caller inputs once per scan instead of once per signal
+    symbol = Signal.normalize_symbol(symbol)
+    timeframe = Signal.normalize_timeframe(timeframe)
+    # Bind config once; the builders below take plain scalars instead of cfg
+    entry_buf, sl_buf = cfg.entry_buffer, cfg.sl_buffer
+    min_tgt, min_rr = cfg.min_target, cfg.min_rr
+    conf, risk_label = cfg.confidence_default, cfg.risk_label
+    now = datetime.now(timezone.utc)  # one timestamp for the whole batch
+
+    if state is not None:
+        eqh_clusters, eql_clusters = state.update(symbol, timeframe, highs, lows, cfg)
+    else:
+        eqh_clusters, eql_clusters = detect_eqh_eql(
+            highs=highs,
+            lows=lows,
+            tolerance=cfg.tolerance,
+            min_bars_between=cfg.min_bars_between,
+            min_points=cfg.min_points,
+        )
+
+    signals: List[SignalRaw] = []
+    rr_keys: List[float] = []
+    if not eqh_clusters or not eql_clusters:
+        return signals
+
+    # Clusters come back sorted by level: pair and filter each side in one pass
+    eqh_lvls = np.fromiter((c.level for c in eqh_clusters), dtype=np.float64, count=len(eqh_clusters))
+    eql_lvls = np.fromiter((c.level for c in eql_clusters), dtype=np.float64, count=len(eql_clusters))
+
+    # SELL candidates from EQH -> nearest EQL below
+    pair, mask, rr, sl = _build_sells_bulk(eqh_lvls, eql_lvls, entry_buf, sl_buf, min_tgt, min_rr)
+    for i in np.flatnonzero(mask).tolist():
+        rr_r = round(float(rr[i]), 4)
+        if rr_r <= 0:  # Signal requires rr > 0 after rounding
+            continue
+        rr_keys.append(rr_r)
+        signals.append(_build_sell_from_eqh(
+            symbol, timeframe, eqh_clusters[i], eql_clusters[pair[i]], rr_keys[-1],
+            float(sl[i]), entry_buf, conf, risk_label, now,
+        ))
+
+    # BUY candidates from EQL -> nearest EQH above
+    pair, mask, rr, sl = _build_buys_bulk(eql_lvls, eqh_lvls, entry_buf, sl_buf, min_tgt, min_rr)
+    for i in np.flatnonzero(mask).tolist():
+        rr_r = round(float(rr[i]), 4)
+        if rr_r <= 0:  # Signal requires rr > 0 after rounding
+            continue
+        rr_keys.append(rr_r)
+        signals.append(_build_buy_from_eql(
+            symbol, timeframe, eql_clusters[i], eqh_clusters[pair[i]], rr_keys[-1],
+            float(sl[i]), entry_buf, conf, risk_label, now,
+        ))
+
+    # Sort by confidence desc, then RR desc (simple ordering for now); lexsort is stable
+    order = np.lexsort((-np.array(rr_keys), -np.full(len(signals), conf)))
+    return [signals[i] for i in order.tolist()]
+
+
 def scan_signals(
     symbol: str,
     highs: Sequence[float],
     lows: Sequence[float],
     cfg: Optional[EngineConfig] = None,
     timeframe: str = "M15",
+    state: Optional[IncrementalEngineState] = None,
 ) -> List[Signal]:
     """
     Main API for v1:
     Given highs/lows arrays, detect EQH/EQL and generate Signals.
 
-    Returns a list of validated Signal objects.
+    Returns a list of Signal objects (engine-guaranteed invariants, built
+    without re-validation). For live scanning pass an IncrementalEngineState
+    to reuse swings/clusters from the previous call.
     """
-    cfg = cfg or EngineConfig()
-    eqh_clusters, eql_clusters = detect_eqh_eql(
-        highs=highs,
-        lows=lows,
-        tolerance=cfg.tolerance,
-        min_bars_between=cfg.min_bars_between,
-        min_points=cfg.min_points,
-    )
-
-    signals: List[Signal] = []
-
-    # SELL candidates from EQH -> nearest EQL
-    for eqh in eqh_clusters:
-        s = _build_sell_from_eqh(symbol, timeframe, eqh, eql_clusters, cfg)
-        if s:
-            signals.append(s)
-
-    # BUY candidates from EQL -> nearest EQH
-    for eql in eql_clusters:
-        s = _build_buy_from_eql(symbol, timeframe, eql, eqh_clusters, cfg)
-        if s:
-            signals.append(s)
-
-    # Sort by confidence desc, then RR desc (simple ordering for now)
-    signals.sort(key=lambda x: (x.confidence, x.rr), reverse=True)
-    return signals
+    raw = scan_signals_raw(symbol, highs, lows, cfg, timeframe, state)
+    return [Signal.from_raw(s) for s in raw]
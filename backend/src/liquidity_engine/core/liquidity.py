@@ -1,35 +1,138 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from typing import List, Literal, Optional, Sequence, Tuple
 
+import numpy as np
+
+from liquidity_engine.core._nb_kernels import NUMBA_AVAILABLE, cluster_sweep_nb, detect_swings_nb
+
 
 Side = Literal["HIGH", "LOW"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SwingPoint:
     index: int
     price: float
     side: Side  # "HIGH" or "LOW"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LiquidityCluster:
     """
     Represents an EQH or EQL cluster.
     - level: representative price level (mean of points)
-    - points: underlying swing points used for this cluster
+    - indices/prices: underlying swing points stored column-wise (chronological)
+    - points: SwingPoint view of the above, built on access (debug/output)
     """
     side: Side
     level: float
-    points: Tuple[SwingPoint, ...]
+    indices: Tuple[int, ...]
+    prices: Tuple[float, ...]
+
+    @property
+    def points(self) -> Tuple[SwingPoint, ...]:
+        return tuple(SwingPoint(index=i, price=p, side=self.side)
+                     for i, p in zip(self.indices, self.prices))
 
 
 # ---------------------------
 # Swing detection (3-bar fractal)
 # ---------------------------
 
+# Below this many bars, list -> ndarray conversion and kernel dispatch cost
+# more than a scalar scan.
+_MIN_VECTOR_BARS = 64
+
+
+def _scan_swings_py(
+    highs: Sequence[float],
+    lows: Sequence[float],
+    start: int = 1,
+    stop: Optional[int] = None,
+) -> Tuple[array, array, array, array]:
+    """
+    Scalar 3-bar fractal scan of bars start..stop-1 (default: every bar with two
+    neighbours) into compact array buffers (hi_idx, hi_px, lo_idx, lo_px).
+    The only Python-side copy of the rule: the short-window path of
+    detect_swings and swings_at both go through it.
+    """
+    if stop is None:
+        stop = len(highs) - 1
+    hi_idx, hi_px = array("q"), array("d")
+    lo_idx, lo_px = array("q"), array("d")
+    for i in range(start, stop):
+        h1 = highs[i]
+        if h1 > highs[i - 1] and h1 > highs[i + 1]:
+            hi_idx.append(i)
+            hi_px.append(h1)
+        l1 = lows[i]
+        if l1 < lows[i - 1] and l1 < lows[i + 1]:
+            lo_idx.append(i)
+            lo_px.append(l1)
+    return hi_idx, hi_px, lo_idx, lo_px
+
+
+def swings_at(
+    highs: Sequence[float],
+    lows: Sequence[float],
+    i: int,
+) -> List[SwingPoint]:
+    """
+    Swing(s) at bar i alone (needs 0 < i < len - 1), HIGH before LOW, using the
+    same 3-bar fractal rule as detect_swings. For incremental updates.
+    """
+    _, hi_px, _, lo_px = _scan_swings_py(highs, lows, i, i + 1)
+    return ([SwingPoint(index=i, price=p, side="HIGH") for p in hi_px]
+            + [SwingPoint(index=i, price=p, side="LOW") for p in lo_px])
+
+
+def _swing_arrays(
+    highs: Sequence[float],
+    lows: Sequence[float],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vector path of detect_swings (n >= 3): (hi_idx, hi_px, lo_idx, lo_px) arrays."""
+    h = np.ascontiguousarray(highs, dtype=np.float64)
+    l = np.ascontiguousarray(lows, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        return detect_swings_nb(h, l)
+
+    # One vectorized comparison per neighbour instead of a Python loop per bar
+    hi_mask = (h[1:-1] > h[:-2]) & (h[1:-1] > h[2:])
+    lo_mask = (l[1:-1] < l[:-2]) & (l[1:-1] < l[2:])
+    hi_idx = np.flatnonzero(hi_mask) + 1
+    lo_idx = np.flatnonzero(lo_mask) + 1
+    return hi_idx, h[hi_idx], lo_idx, l[lo_idx]
+
+
+def detect_swing_arrays(
+    highs: Sequence[float],
+    lows: Sequence[float],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Column form of detect_swings: (hi_idx, hi_px, lo_idx, lo_px) as int64/float64
+    arrays, chronological per side. Engine callers feed these straight into
+    cluster_equal_levels_arrays; on long windows most of detect_swings' time
+    goes into building SwingPoint objects, not into the comparisons.
+    """
+    if len(highs) != len(lows):
+        raise ValueError("highs and lows must have same length")
+    n = len(highs)
+    if n < 3:
+        return (np.empty(0, np.int64), np.empty(0, np.float64),
+                np.empty(0, np.int64), np.empty(0, np.float64))
+
+    if n < _MIN_VECTOR_BARS:
+        hi_idx, hi_px, lo_idx, lo_px = _scan_swings_py(highs, lows)
+        return (np.array(hi_idx, dtype=np.int64), np.array(hi_px, dtype=np.float64),
+                np.array(lo_idx, dtype=np.int64), np.array(lo_px, dtype=np.float64))
+    return _swing_arrays(highs, lows)
+
+
 def detect_swings(
     highs: Sequence[float],
     lows: Sequence[float],
@@ -45,19 +148,25 @@ def detect_swings(
     if n < 3:
         return []
 
-    swings: List[SwingPoint] = []
-    for i in range(1, n - 1):
-        h0, h1, h2 = highs[i - 1], highs[i], highs[i + 1]
-        l0, l1, l2 = lows[i - 1], lows[i], lows[i + 1]
+    if n < _MIN_VECTOR_BARS:
+        hi_idx, hi_px, lo_idx, lo_px = _scan_swings_py(highs, lows)
+        swings = ([SwingPoint(index=i, price=p, side="HIGH") for i, p in zip(hi_idx, hi_px)]
+                  + [SwingPoint(index=i, price=p, side="LOW") for i, p in zip(lo_idx, lo_px)])
+        swings.sort(key=lambda s: s.index)  # stable: HIGH before LOW on the same bar
+        return swings
 
-        if h1 > h0 and h1 > h2:
-            swings.append(SwingPoint(index=i, price=float(h1), side="HIGH"))
-        if l1 < l0 and l1 < l2:
-            swings.append(SwingPoint(index=i, price=float(l1), side="LOW"))
+    hi_idx, hi_px, lo_idx, lo_px = _swing_arrays(highs, lows)
 
-    # Keep chronological order
-    swings.sort(key=lambda s: s.index)
-    return swings
+    # Keep chronological order (stable: HIGH before LOW on the same bar)
+    idx = np.concatenate((hi_idx, lo_idx))
+    order = np.argsort(idx, kind="stable")
+
+    hi_swings = [SwingPoint(index=i, price=p, side="HIGH")
+                 for i, p in zip(hi_idx.tolist(), hi_px.tolist())]
+    lo_swings = [SwingPoint(index=i, price=p, side="LOW")
+                 for i, p in zip(lo_idx.tolist(), lo_px.tolist())]
+    swings = hi_swings + lo_swings
+    return [swings[k] for k in order.tolist()]
 
 
 # ---------------------------
@@ -77,9 +186,47 @@ def cluster_equal_levels(
     - |price - cluster_level| <= tolerance
     - consecutive points must be separated by min_bars_between
 
+    Each open cluster keeps a running price sum, so its level is not re-summed
+    on every membership check.
+
     Note: tolerance is in the same units as price (points). If you use pips,
     convert first at the caller level.
     """
+    _check_cluster_args(tolerance, min_bars_between, min_points)
+
+    indices = [s.index for s in swings if s.side == side]
+    prices = [s.price for s in swings if s.side == side]
+    if NUMBA_AVAILABLE:
+        return _cluster_equal_levels_nb(np.array(indices, dtype=np.int64),
+                                        np.array(prices, dtype=np.float64),
+                                        side, tolerance, min_bars_between, min_points)
+    return _cluster_equal_levels_py(indices, prices, side, tolerance, min_bars_between, min_points)
+
+
+def cluster_equal_levels_arrays(
+    indices: np.ndarray,
+    prices: np.ndarray,
+    side: Side,
+    tolerance: float,
+    min_bars_between: int = 5,
+    min_points: int = 2,
+) -> List[LiquidityCluster]:
+    """
+    Column form of cluster_equal_levels for one side's swings, e.g. the
+    (hi_idx, hi_px) or (lo_idx, lo_px) pair from detect_swing_arrays.
+    Same rule and output; no SwingPoint objects are built.
+    """
+    _check_cluster_args(tolerance, min_bars_between, min_points)
+
+    indices = np.asarray(indices, dtype=np.int64)
+    prices = np.asarray(prices, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _cluster_equal_levels_nb(indices, prices, side, tolerance, min_bars_between, min_points)
+    return _cluster_equal_levels_py(indices.tolist(), prices.tolist(), side,
+                                    tolerance, min_bars_between, min_points)
+
+
+def _check_cluster_args(tolerance: float, min_bars_between: int, min_points: int) -> None:
     if tolerance <= 0:
         raise ValueError("tolerance must be > 0")
     if min_bars_between < 0:
@@ -87,44 +234,84 @@ def cluster_equal_levels(
     if min_points < 2:
         raise ValueError("min_points must be >= 2")
 
-    pts = [s for s in swings if s.side == side]
-    if not pts:
-        return []
 
-    clusters: List[List[SwingPoint]] = []
+def _cluster_equal_levels_py(
+    indices: Sequence[int],
+    prices: Sequence[float],
+    side: Side,
+    tolerance: float,
+    min_bars_between: int,
+    min_points: int,
+) -> List[LiquidityCluster]:
+    """Pure-Python cluster_equal_levels on one side's columns (reference for _cluster_equal_levels_nb)."""
+    if not indices:
+        return []
 
-    for p in pts:
-        placed = False
+    # Open clusters, column-wise: last bar index, running price sum and the
+    # struct-of-arrays members (indices 'q', prices 'd'), in creation order.
+    lasts: List[int] = []
+    sums: List[float] = []
+    members: List[Tuple[array, array]] = []
 
+    for index, price in zip(indices, prices):
         # Try place into existing cluster if within tolerance AND bar distance ok
-        for c in clusters:
-            last = c[-1]
+        for k, last in enumerate(lasts):
             # enforce spacing
-            if (p.index - last.index) < min_bars_between:
+            if (index - last) < min_bars_between:
                 continue
 
             # cluster level based on current points mean
-            level = sum(x.price for x in c) / len(c)
-            if abs(p.price - level) <= tolerance:
-                c.append(p)
-                placed = True
+            c_idx, c_px = members[k]
+            if abs(price - sums[k] / len(c_px)) <= tolerance:
+                c_idx.append(index)
+                c_px.append(price)
+                lasts[k] = index
+                sums[k] += price
                 break
-
-        if not placed:
-            clusters.append([p])
+        else:
+            lasts.append(index)
+            sums.append(price)
+            members.append((array("q", [index]), array("d", [price])))
 
     # Build LiquidityCluster objects; keep only those with >= min_points
+    # Levels reuse the running sums: plain in-order addition, like the compiled
+    # kernel (built-in sum() is compensated from Python 3.12 and can differ by an ulp).
     out: List[LiquidityCluster] = []
-    for c in clusters:
-        if len(c) >= min_points:
-            level = sum(x.price for x in c) / len(c)
-            out.append(LiquidityCluster(side=side, level=float(level), points=tuple(c)))
+    for (c_idx, c_px), total in zip(members, sums):
+        if len(c_idx) >= min_points:
+            level = total / len(c_px)
+            out.append(LiquidityCluster(side=side, level=float(level),
+                                        indices=tuple(c_idx), prices=tuple(c_px)))
 
     # Sort by level for easier target selection (LOW ascending, HIGH ascending)
     out.sort(key=lambda cl: cl.level)
     return out
 
 
+def _cluster_equal_levels_nb(
+    idx: np.ndarray,
+    px: np.ndarray,
+    side: Side,
+    tolerance: float,
+    min_bars_between: int,
+    min_points: int,
+) -> List[LiquidityCluster]:
+    """cluster_equal_levels via the compiled sweep; only survivors become Python objects."""
+    order, starts, ends, levels = cluster_sweep_nb(
+        px, idx, float(tolerance), int(min_bars_between), int(min_points),
+    )
+
+    idx_sorted = idx[order].tolist()
+    px_sorted = px[order].tolist()
+    out = [
+        LiquidityCluster(side=side, level=lvl,
+                         indices=tuple(idx_sorted[a:b]), prices=tuple(px_sorted[a:b]))
+        for a, b, lvl in zip(starts.tolist(), ends.tolist(), levels.tolist())
+    ]
+    out.sort(key=lambda cl: cl.level)
+    return out
+
+
 def detect_eqh_eql(
     highs: Sequence[float],
     lows: Sequence[float],
@@ -135,11 +322,11 @@ def detect_eqh_eql(
     """
     Returns (eqh_clusters, eql_clusters)
     """
-    swings = detect_swings(highs, lows)
-    eqh = cluster_equal_levels(swings, side="HIGH", tolerance=tolerance,
-                              min_bars_between=min_bars_between, min_points=min_points)
-    eql = cluster_equal_levels(swings, side="LOW", tolerance=tolerance,
-                              min_bars_between=min_bars_between, min_points=min_points)
+    hi_idx, hi_px, lo_idx, lo_px = detect_swing_arrays(highs, lows)
+    eqh = cluster_equal_levels_arrays(hi_idx, hi_px, side="HIGH", tolerance=tolerance,
+                                      min_bars_between=min_bars_between, min_points=min_points)
+    eql = cluster_equal_levels_arrays(lo_idx, lo_px, side="LOW", tolerance=tolerance,
+                                      min_bars_between=min_bars_between, min_points=min_points)
     return eqh, eql
 
 
@@ -150,8 +337,16 @@ def detect_eqh_eql(
 def nearest_liquidity_below(
     level: float,
     clusters: Sequence[LiquidityCluster],
+    levels: Optional[Sequence[float]] = None,
 ) -> Optional[LiquidityCluster]:
-    """Nearest cluster with level < given level."""
+    """
+    Nearest cluster with level < given level.
+    If `levels` (the clusters' levels, sorted ascending and aligned with
+    clusters) is given, uses bisect; otherwise scans clusters in any order.
+    """
+    if levels is not None:
+        idx = bisect_left(levels, level)
+        return clusters[idx - 1] if idx > 0 else None
     below = [c for c in clusters if c.level < level]
     if not below:
         return None
@@ -161,8 +356,15 @@ def nearest_liquidity_below(
 def nearest_liquidity_above(
     level: float,
     clusters: Sequence[LiquidityCluster],
+    levels: Optional[Sequence[float]] = None,
 ) -> Optional[LiquidityCluster]:
-    """Nearest cluster with level > given level."""
+    """
+    Nearest cluster with level > given level.
+    Same `levels` contract as nearest_liquidity_below.
+    """
+    if levels is not None:
+        idx = bisect_right(levels, level)
+        return clusters[idx] if idx < len(clusters) else None
     above = [c for c in clusters if c.level > level]
     if not above:
         return None
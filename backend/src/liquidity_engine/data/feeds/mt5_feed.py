@@ -1,11 +1,40 @@
 from __future__ import annotations
 
+import re
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import MetaTrader5 as mt5
-import pandas as pd
+import numpy as np
+
+# MetaTrader5 (Windows-only DLL) and pandas are imported inside the functions
+# that need them, so importing this module stays cheap and works anywhere.
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@cache
+def _tf_map() -> Dict[str, int]:
+    import MetaTrader5 as mt5
+
+    return {
+        "M1": mt5.TIMEFRAME_M1,
+        "M5": mt5.TIMEFRAME_M5,
+        "M15": mt5.TIMEFRAME_M15,
+        "M30": mt5.TIMEFRAME_M30,
+        "H1": mt5.TIMEFRAME_H1,
+        "H4": mt5.TIMEFRAME_H4,
+        "D1": mt5.TIMEFRAME_D1,
+    }
+
+# Broker symbol list snapshot (symbols_get is a full IPC round-trip)
+SYMBOLS_TTL_SECONDS = 300.0
+_symbols_snapshot: Optional[Dict[str, Any]] = None
+_symbols_upper: Tuple[Tuple[str, str], ...] = ()  # (name, NAME) pairs, same snapshot
+_symbols_loaded_at = 0.0
+_ensured_symbols: Dict[str, str] = {}  # symbol -> resolved, only if already visible
 
 
 @dataclass(frozen=True)
@@ -21,6 +50,8 @@ def connect(cfg: MT5Config) -> None:
     Connect to MT5 in read-only mode.
     IMPORTANT: Never pass None for path/login/server/password.
     """
+    import MetaTrader5 as mt5
+
     # Build kwargs only with real values
     kwargs = {}
 
@@ -35,16 +66,49 @@ def connect(cfg: MT5Config) -> None:
         kwargs["password"] = str(cfg.password)
         kwargs["server"] = str(cfg.server)
 
+    _clear_symbol_caches()
     ok = mt5.initialize(**kwargs)
     if not ok:
         raise RuntimeError(f"MT5 initialize failed: {mt5.last_error()}")
 
 
+def shutdown() -> None:
+    import MetaTrader5 as mt5
 
+    _clear_symbol_caches()
+    mt5.shutdown()
 
 
-def shutdown() -> None:
-    mt5.shutdown()
+def _clear_symbol_caches() -> None:
+    global _symbols_snapshot
+    _symbols_snapshot = None
+    _resolve_symbol.cache_clear()
+    _ensured_symbols.clear()
+
+
+def _expire_symbol_caches() -> None:
+    """Drops the snapshot and every lookup derived from it once the TTL has passed."""
+    if _symbols_snapshot is not None and time.monotonic() - _symbols_loaded_at > SYMBOLS_TTL_SECONDS:
+        _clear_symbol_caches()
+
+
+def _broker_symbols() -> Dict[str, Any]:
+    """
+    name -> SymbolInfo from a single symbols_get() call, refreshed after the TTL.
+    A failed or empty result raises and is not cached, so the next call retries.
+    """
+    import MetaTrader5 as mt5
+
+    global _symbols_snapshot, _symbols_upper, _symbols_loaded_at
+    _expire_symbol_caches()
+    if _symbols_snapshot is None:
+        all_syms = mt5.symbols_get()
+        if not all_syms:
+            raise RuntimeError(f"MT5 symbols_get returned no symbols: {mt5.last_error()}")
+        _symbols_snapshot = {s.name: s for s in all_syms}
+        _symbols_upper = tuple((n, n.upper()) for n in _symbols_snapshot)
+        _symbols_loaded_at = time.monotonic()
+    return _symbols_snapshot
 
 
 def resolve_symbol(requested: str) -> str:
@@ -54,17 +118,27 @@ def resolve_symbol(requested: str) -> str:
       XAUUSD -> XAUUSDm, XAUUSD.a, GOLD, GOLDm
       BTCUSD -> BTCUSD, BTCUSDm, BTCUSD.a, BTCUSDT
     """
-    requested = requested.strip().upper()
+    _expire_symbol_caches()
+    return _resolve_symbol(requested.strip().upper())
+
+
+@lru_cache(maxsize=256)
+def _resolve_symbol(requested: str) -> str:
+    import MetaTrader5 as mt5
+
+    try:
+        symbols = _broker_symbols()
+        list_error = None
+    except RuntimeError as e:
+        symbols, list_error = {}, e
 
-    # Exact match first
-    info = mt5.symbol_info(requested)
-    if info is not None:
+    # Exact match first (snapshot, else a direct symbol_info lookup)
+    if requested in symbols or mt5.symbol_info(requested) is not None:
         return requested
+    if list_error is not None:
+        raise list_error
 
     # Search by contains rules
-    all_syms = mt5.symbols_get()
-    names = [s.name for s in all_syms]
-
     # Priority candidate patterns per requested
     patterns = []
     if requested == "XAUUSD":
@@ -75,11 +149,9 @@ def resolve_symbol(requested: str) -> str:
         # fallback: use requested tokens
         patterns = [requested]
 
-    candidates = []
-    for n in names:
-        nu = n.upper()
-        if any(p in nu for p in patterns):
-            candidates.append(n)
+    # One regex alternation per name instead of len(patterns) substring checks
+    matcher = re.compile("|".join(map(re.escape, patterns)))
+    candidates = [n for n, nu in _symbols_upper if matcher.search(nu)]
 
     if not candidates:
         raise RuntimeError(f"Symbol not found in MT5 (requested={requested}). No candidates matched {patterns}.")
@@ -90,6 +162,13 @@ def resolve_symbol(requested: str) -> str:
 
 
 def ensure_symbol(symbol: str) -> str:
+    import MetaTrader5 as mt5
+
+    _expire_symbol_caches()
+    cached = _ensured_symbols.get(symbol)
+    if cached is not None:
+        return cached
+
     resolved = resolve_symbol(symbol)
 
     info = mt5.symbol_info(resolved)
@@ -99,26 +178,26 @@ def ensure_symbol(symbol: str) -> str:
     if not info.visible:
         if not mt5.symbol_select(resolved, True):
             raise RuntimeError(f"Failed to select symbol: {resolved}")
+        # Was hidden in the terminal: check visibility again next time
+    else:
+        _ensured_symbols[symbol] = resolved
 
     return resolved
 
 
-
-def fetch_rates(
+def fetch_rates_raw(
     symbol: str,
     timeframe: str = "M15",
     count: int = 3000,
-) -> pd.DataFrame:
-    tf_map = {
-        "M1": mt5.TIMEFRAME_M1,
-        "M5": mt5.TIMEFRAME_M5,
-        "M15": mt5.TIMEFRAME_M15,
-        "M30": mt5.TIMEFRAME_M30,
-        "H1": mt5.TIMEFRAME_H1,
-        "H4": mt5.TIMEFRAME_H4,
-        "D1": mt5.TIMEFRAME_D1,
-    }
-    tf = tf_map.get(timeframe.upper())
+) -> np.ndarray:
+    """
+    Returns the MT5 structured array as-is (fields: time, open, high, low,
+    close, tick_volume, spread, real_volume). No copy; the engine can read
+    rates["high"] / rates["low"] directly.
+    """
+    import MetaTrader5 as mt5
+
+    tf = _tf_map().get(timeframe.upper())
     if tf is None:
         raise ValueError(f"Unsupported timeframe: {timeframe}")
 
@@ -131,11 +210,31 @@ def fetch_rates(
     if len(rates) == 0:
         raise RuntimeError("No rates returned. Check chart subscription / symbol / timeframe.")
 
-    df = pd.DataFrame(rates)
+    return rates
+
+
+def rates_to_frame(rates: np.ndarray) -> pd.DataFrame:
+    """Builds the time/open/high/low/close/volume DataFrame from column views."""
+    import pandas as pd
+
     # MT5 returns 'time' as unix seconds
-    df["time"] = pd.to_datetime(df["time"], unit="s", utc=True)
-    df.rename(columns={"tick_volume": "volume"}, inplace=True)
-    return df[["time", "open", "high", "low", "close", "volume"]]
+    time_utc = pd.Series(rates["time"].astype("datetime64[s]")).dt.tz_localize("UTC")
+    return pd.DataFrame({
+        "time": time_utc,
+        "open": rates["open"],
+        "high": rates["high"],
+        "low": rates["low"],
+        "close": rates["close"],
+        "volume": rates["tick_volume"],
+    })
+
+
+def fetch_rates(
+    symbol: str,
+    timeframe: str = "M15",
+    count: int = 3000,
+) -> pd.DataFrame:
+    return rates_to_frame(fetch_rates_raw(symbol, timeframe=timeframe, count=count))
 
 
 def export_rates_csv(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from typing import List, Optional, Tuple
@@ -27,6 +28,31 @@ class LiquidityType(str, Enum):
 
 # ---------- Models ----------
 
+@dataclass(frozen=True, slots=True)
+class SignalRaw:
+    """
+    Lightweight engine-side mirror of Signal (no validation).
+    Built in the scan hot path; convert with Signal.from_raw at API boundaries.
+    """
+
+    symbol: str
+    timeframe: str
+    direction: Direction
+    entry_zone: Tuple[float, float]
+    stop_loss: float
+    targets: Tuple[float, ...]
+    rr: float
+    liquidity_type: LiquidityType
+    confidence: int
+    risk: RiskLabel
+    setup_id: Optional[str] = None
+    session: Optional[str] = None
+    created_at: Optional[datetime] = None
+    level: Optional[float] = None
+    tolerance_pips: Optional[float] = None
+    min_target_pips: Optional[float] = None
+
+
 class Signal(BaseModel):
     """
     Core Signal contract used across:
@@ -104,6 +130,8 @@ class Signal(BaseModel):
     @field_validator("created_at")
     @classmethod
     def ensure_timezone(cls, v: datetime) -> datetime:
+        if v.tzinfo is timezone.utc:
+            return v  # already normalized (engine batches, default_factory)
         if v.tzinfo is None:
             return v.replace(tzinfo=timezone.utc)
         return v.astimezone(timezone.utc)
@@ -139,6 +167,35 @@ class Signal(BaseModel):
 
         return self
 
+    # ---------- Engine fast path ----------
+
+    @classmethod
+    def _build_from_engine(cls, **kwargs) -> "Signal":
+        """
+        model_construct for values coming out of scan_signals_raw only (see
+        from_raw): no float() coercion of entry_zone/targets and no validators.
+        Everything else (FastAPI, Telegram parsing, DB deserialization) must use
+        the regular constructor.
+        """
+        if __debug__:
+            assert all(isinstance(x, float) for x in kwargs["entry_zone"]), "entry_zone must hold floats"
+            assert all(isinstance(x, float) for x in kwargs["targets"]), "targets must hold floats"
+        return cls.model_construct(**kwargs)
+
+    @classmethod
+    def from_raw(cls, raw: SignalRaw) -> "Signal":
+        """
+        Builds a Signal from engine output without re-running validators.
+        Only for SignalRaw produced by scan_signals_raw: EngineConfig rejects bad
+        buffers/confidence, the bulk masks drop candidates breaking the entry/SL/TP
+        invariants, and symbol/timeframe are normalized once per scan.
+        """
+        values = {name: getattr(raw, name) for name in SignalRaw.__slots__}
+        values["targets"] = list(raw.targets)
+        if raw.created_at is None:
+            del values["created_at"]  # let default_factory stamp it
+        return cls._build_from_engine(**values)
+
     # Convenience: human-readable summary
     def summary(self) -> str:
         low, high = self.entry_zone